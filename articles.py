@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""知识库文章工具统一入口
+
+在同一进程内对同一份articles.json数据依次执行各阶段，只解析一次JSON：
+
+    python articles.py generate      # 生成缺失的HTML文件
+    python articles.py standardize   # 标准化文章ID并重命名HTML文件
+    python articles.py all           # 先标准化ID，再生成缺失的HTML文件
+"""
+import argparse
+
+from generate_missing_articles import generate_missing_html
+from standardize_article_ids import load_articles_json, standardize_ids
+
+# 各阶段按此顺序执行：先标准化ID，再按新ID生成缺失页面
+PHASES = {
+    'standardize': standardize_ids,
+    'generate': generate_missing_html,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Mobius知识库文章工具")
+    parser.add_argument('command', choices=[*PHASES, 'all'], help="要执行的阶段")
+    args = parser.parse_args()
+
+    phases = list(PHASES) if args.command == 'all' else [args.command]
+
+    print("📂 加载articles.json...")
+    data = load_articles_json()
+
+    for phase in phases:
+        print(f"\n🚀 执行阶段: {phase}")
+        PHASES[phase](data)
+
+if __name__ == "__main__":
+    main()
@@ -1,155 +1,98 @@
 #!/usr/bin/env python3
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-def extract_article_ids():
-    """从articles.json中提取所有文章ID"""
-    with open('data/articles.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+from html_template import render_article
+from standardize_article_ids import fsync_directory, load_articles_json
 
-    article_ids = []
-    # 提取categories中的所有文章ID
-    for category, articles in data['categories'].items():
-        for article in articles:
-            article_ids.append(article['id'])
+def iter_articles(data):
+    """依次遍历categories中的文章及FAQ数据（如果有的话）"""
+    for articles in data['categories'].values():
+        yield from articles
 
-    # 如果有FAQ数据，则提取FAQ中的ID
     if 'faqs' in data:
-        for category, faqs in data['faqs'].items():
-            for faq in faqs:
-                article_ids.append(faq['id'])
+        for faqs in data['faqs'].values():
+            yield from faqs
 
-    return article_ids
+def extract_article_ids(data):
+    """从articles.json数据中提取所有文章ID"""
+    return [article['id'] for article in iter_articles(data)]
 
 def get_existing_html_files():
     """获取已存在的HTML文件名（不含扩展名）"""
     html_dir = 'knowledge'
     if not os.path.exists(html_dir):
-        return []
+        return set()
 
-    existing_files = []
-    for file in os.listdir(html_dir):
-        if file.endswith('.html'):
-            existing_files.append(file[:-5])  # 移除.html扩展名
-
-    return existing_files
+    # 使用scandir直接读取目录项，返回集合便于O(1)成员判断
+    with os.scandir(html_dir) as it:
+        return {entry.name[:-5] for entry in it  # 移除.html扩展名
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith('.html')}
 
 def generate_html_for_article(article_data, output_dir):
-    """为单篇文章生成HTML文件"""
-    article_id = article_data['id']
-    title = article_data['title']
-    excerpt = article_data['excerpt']
-    date = article_data['date']
-    reading_time = article_data['readingTime']
-    content = article_data.get('content', '')
-
-    # 生成HTML内容
-    html_content = f"""<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Mobius知识库</title>
-    <meta name="description" content="{excerpt}">
-    <link rel="stylesheet" href="../style.css">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Noto+Sans+SC:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">
-</head>
-<body>
-    <div class="container">
-        <article class="knowledge-article">
-            <header class="article-header">
-                <div class="article-meta">
-                    <span class="article-date">{date}</span>
-                    <span class="article-reading-time">{reading_time}</span>
-                </div>
-                <h1 class="article-title">{title}</h1>
-                <div class="article-excerpt">
-                    <p>{excerpt}</p>
-                </div>
-            </header>
-
-            <div class="article-content">
-                <div class="content-wrapper">
-                    {content}
-                </div>
-            </div>
-
-            <footer class="article-footer">
-                <div class="article-tags">
-                    {generate_tags(article_data.get('tags', []))}
-                </div>
-                <div class="article-back-link">
-                    <a href="../knowledge.html" class="back-link">
-                        <i class="fas fa-arrow-left"></i>
-                        返回知识库
-                    </a>
-                </div>
-            </footer>
-        </article>
-    </div>
-</body>
-</html>"""
-
-    # 写入HTML文件
-    os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, f"{article_id}.html")
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-
-    print(f"✅ 生成HTML文件: {output_path}")
-
-def generate_tags(tags):
-    """生成标签HTML"""
-    if not tags:
-        return ""
-
-    tag_html = ""
-    for tag in tags:
-        tag_html += f'<span class="article-tag">{tag}</span>'
-
-    return tag_html
+    """为单篇文章生成HTML内容，返回(输出路径, UTF-8编码的字节)
 
-def main():
-    print("🚀 开始分析articles.json并生成缺失的HTML文件...")
+    调用方需确保output_dir已存在。
+    """
+    output_path = os.path.join(output_dir, f"{article_data['id']}.html")
+    return output_path, render_article(article_data)
+
+def _write_html_file(output):
+    """写入单个(路径, 字节)HTML文件，返回输出路径"""
+    output_path, html_bytes = output
+    with open(output_path, 'wb') as f:
+        f.write(html_bytes)
+
+    return output_path
+
+def write_html_files(outputs):
+    """批量写入(路径, 字节)形式的HTML文件（write()期间释放GIL，用线程池并发写入）"""
+    if not outputs:
+        return
+
+    # 重复ID会生成同一路径，并发写入时结果不确定；与顺序写入一致，保留最后一条
+    outputs = list(dict(outputs).items())
+
+    with ThreadPoolExecutor(max_workers=min(32, len(outputs))) as executor:
+        for output_path in executor.map(_write_html_file, outputs):
+            print(f"✅ 生成HTML文件: {output_path}")
 
+    # 不逐个文件fsync，全部写完后对每个输出目录fsync一次
+    for output_dir in {os.path.dirname(output_path) or '.' for output_path, _ in outputs}:
+        fsync_directory(output_dir)
+
+def generate_missing_html(data):
+    """为articles.json数据中缺失HTML文件的文章生成页面"""
     # 获取所有文章ID
-    article_ids = extract_article_ids()
+    article_ids = extract_article_ids(data)
     print(f"📋 发现 {len(article_ids)} 篇文章")
 
     # 获取已存在的HTML文件
     existing_files = get_existing_html_files()
     print(f"📁 已存在 {len(existing_files)} 个HTML文件")
 
-    # 找出缺失的文章
-    missing_articles = []
-    with open('data/articles.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    for category, articles in data['categories'].items():
-        for article in articles:
-            if article['id'] not in existing_files:
-                missing_articles.append(article)
-
-    # 如果有FAQ数据，也检查FAQ中的缺失文件
-    if 'faqs' in data:
-        for category, faqs in data['faqs'].items():
-            for faq in faqs:
-                if faq['id'] not in existing_files:
-                    missing_articles.append(faq)
+    # 找出缺失的文章：单次遍历文章及FAQ，按ID集合判断是否缺失
+    missing_articles = [article for article in iter_articles(data)
+                        if article['id'] not in existing_files]
 
     print(f"❌ 缺失 {len(missing_articles)} 个HTML文件")
 
     # 为缺失的文章生成HTML文件
     if missing_articles:
         print("\n📝 开始生成HTML文件...")
-        for article in missing_articles:
-            generate_html_for_article(article, 'knowledge')
+        os.makedirs('knowledge', exist_ok=True)
+        outputs = [generate_html_for_article(article, 'knowledge')
+                   for article in missing_articles]
+        write_html_files(outputs)
     else:
         print("✅ 所有HTML文件都已存在！")
 
+def main():
+    print("🚀 开始分析articles.json并生成缺失的HTML文件...")
+
+    # 加载articles.json（只解析一次）
+    data = load_articles_json()
+    generate_missing_html(data)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
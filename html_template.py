@@ -0,0 +1,99 @@
+"""知识库文章HTML模板（模块级预编译，供各生成脚本共享）"""
+from functools import lru_cache
+from html import escape
+from string import Template
+
+ARTICLE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title - Mobius知识库</title>
+    <meta name="description" content="$excerpt">
+    <link rel="stylesheet" href="../style.css">
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Noto+Sans+SC:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">
+</head>
+<body>
+    <div class="container">
+        <article class="knowledge-article">
+            <header class="article-header">
+                <div class="article-meta">
+                    <span class="article-date">$date</span>
+                    <span class="article-reading-time">$reading_time</span>
+                </div>
+                <h1 class="article-title">$title</h1>
+                <div class="article-excerpt">
+                    <p>$excerpt</p>
+                </div>
+            </header>
+
+            <div class="article-content">
+                <div class="content-wrapper">
+                    $content
+                </div>
+            </div>
+
+            <footer class="article-footer">
+                <div class="article-tags">
+                    $tags_html
+                </div>
+                <div class="article-back-link">
+                    <a href="../knowledge.html" class="back-link">
+                        <i class="fas fa-arrow-left"></i>
+                        返回知识库
+                    </a>
+                </div>
+            </footer>
+        </article>
+    </div>
+</body>
+</html>""")
+
+
+@lru_cache(maxsize=None)
+def _render_tags(tags):
+    """按标签元组缓存渲染结果，相同标签组合只渲染一次"""
+    return ''.join(f'<span class="article-tag">{escape(tag)}</span>' for tag in tags)
+
+def generate_tags(tags):
+    """生成标签HTML（标签文本经HTML转义）"""
+    return _render_tags(tuple(tags))
+
+def _split_template(template):
+    """把Template拆成预编码的字节片段与占位符名称交替组成的列表"""
+    fragments = []
+    pos = 0
+    for match in template.pattern.finditer(template.template):
+        fragments.append(template.template[pos:match.start()].encode('utf-8'))
+        fragments.append(match.group('named') or match.group('braced'))
+        pos = match.end()
+    fragments.append(template.template[pos:].encode('utf-8'))
+    return fragments
+
+_ARTICLE_FRAGMENTS = _split_template(ARTICLE_TEMPLATE)
+
+def render_article(article_data):
+    """渲染单篇文章页面，返回UTF-8编码的bytearray
+
+    静态部分已预先编码，只需编码各字段后依次追加，避免content较大时先拼出整页str再整体编码。
+    """
+    # 纯文本字段转义后插入，content本身即为HTML
+    values = {
+        'title': escape(article_data['title']),
+        'excerpt': escape(article_data['excerpt']),
+        'date': escape(article_data['date']),
+        'reading_time': escape(article_data['readingTime']),
+        'content': article_data.get('content', ''),
+        'tags_html': generate_tags(article_data.get('tags', [])),
+    }
+
+    buf = bytearray()
+    for fragment in _ARTICLE_FRAGMENTS:
+        if isinstance(fragment, bytes):
+            buf += fragment
+        else:
+            buf += values[fragment].encode('utf-8')
+    return buf
@@ -1,7 +1,17 @@
 #!/usr/bin/env python3
 import json
+import mmap
 import os
+import re
 import shutil
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # 精简环境下回退到标准库json
+    orjson = None
 
 def create_id_mapping():
     """创建当前混乱ID到标准化ID的映射表"""
@@ -42,43 +52,120 @@ def create_id_mapping():
 
 def load_articles_json():
     """加载articles.json文件"""
+    if orjson is not None:
+        with open('data/articles.json', 'rb') as f:
+            return orjson.loads(f.read())
+
     with open('data/articles.json', 'r', encoding='utf-8') as f:
         return json.load(f)
 
 def save_articles_json(data):
-    """保存articles.json文件"""
-    with open('data/articles.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """保存articles.json文件（先完整写入临时文件，再原子替换，避免中途崩溃留下半截JSON）"""
+    if orjson is not None:
+        # orjson直接输出UTF-8字节，不转义非ASCII字符
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+    target = 'data/articles.json'
+    fd, tmp_path = tempfile.mkstemp(dir='data', prefix='.articles.', suffix='.json')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # mkstemp创建的文件权限为0600，沿用原文件的权限
+        if os.path.exists(target):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(target).st_mode))
+
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _index_by_id(items):
+    """按ID建立索引（同一ID可能对应多条记录）"""
+    index = {}
+    for item in items:
+        index.setdefault(item['id'], []).append(item)
+    return index
+
+def fsync_directory(path):
+    """对目录执行一次fsync，批量落盘其中的新建/重命名等元数据变更"""
+    if os.name == 'nt':
+        # Windows无法以文件描述符方式打开目录
+        return
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 def update_articles_ids(data, id_mapping):
     """更新articles.json中的所有ID引用"""
+    # 建立一次ID索引，只遍历映射表中的条目
+    articles_by_id = _index_by_id(
+        article for articles in data['categories'].values() for article in articles)
+
     # 更新categories中的文章ID
-    for category, articles in data['categories'].items():
-        for article in articles:
-            old_id = article['id']
-            if old_id in id_mapping:
-                new_id = id_mapping[old_id]
-                article['id'] = new_id
-
-                # 更新URL字段
-                if 'url' in article:
-                    old_url = article['url']
-                    if old_url.startswith('knowledge/'):
-                        new_url = f"knowledge/{new_id}.html"
-                        article['url'] = new_url
-                    elif old_url.startswith('../services/'):
-                        # FAQ类文章保持原URL，因为它们链接到服务页面
-                        pass
+    for old_id, new_id in id_mapping.items():
+        for article in articles_by_id.get(old_id, ()):
+            article['id'] = new_id
+
+            # 更新URL字段；FAQ类文章链接到服务页面(../services/)，保持原URL
+            url = article.get('url')
+            if url and url.startswith('knowledge/'):
+                article['url'] = f"knowledge/{new_id}.html"
 
     # 更新metadata中的hotContent引用
     if 'hotContent' in data['metadata']:
-        for hot_item in data['metadata']['hotContent']:
-            old_id = hot_item['id']
-            if old_id in id_mapping:
-                hot_item['id'] = id_mapping[old_id]
+        hot_by_id = _index_by_id(data['metadata']['hotContent'])
+        for old_id, new_id in id_mapping.items():
+            for hot_item in hot_by_id.get(old_id, ()):
+                hot_item['id'] = new_id
 
     return data
 
+def compile_data_id_pattern(id_mapping):
+    """编译匹配所有旧ID data-id属性的正则，返回(正则, 替换表)，单次扫描即可完成全部替换"""
+    replacements = {
+        f'data-id="{old_id}"'.encode('utf-8'): f'data-id="{new_id}"'.encode('utf-8')
+        for old_id, new_id in id_mapping.items()
+    }
+    pattern = re.compile(b'|'.join(re.escape(key) for key in replacements))
+    return pattern, replacements
+
+def _rename_html_file(knowledge_dir, old_id, new_id, pattern, replacements):
+    """重命名单个HTML文件，仅在内容包含旧ID引用时重写内容"""
+    old_file = os.path.join(knowledge_dir, f"{old_id}.html")
+    new_file = os.path.join(knowledge_dir, f"{new_id}.html")
+
+    count = 0
+    with open(old_file, 'rb') as f:
+        # 先用mmap检查是否存在data-id属性，没有则无需读取全部内容
+        has_data_id = False
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                has_data_id = mm.find(b'data-id="') != -1
+
+        if has_data_id:
+            # 更新HTML文件中的ID引用（包括对其他文章的交叉引用）
+            new_content, count = pattern.subn(lambda m: replacements[m.group(0)], f.read())
+
+    if not count:
+        # 内容无需修改，直接重命名
+        os.rename(old_file, new_file)
+    else:
+        # 写入新文件并删除旧文件
+        with open(new_file, 'wb') as f:
+            f.write(new_content)
+        os.remove(old_file)
+
+    return old_id, new_id
+
 def rename_html_files(id_mapping):
     """重命名HTML文件以匹配新的ID"""
     knowledge_dir = 'knowledge'
@@ -86,31 +173,31 @@ def rename_html_files(id_mapping):
         print(f"❌ 目录 {knowledge_dir} 不存在")
         return
 
-    renamed_count = 0
+    # 一次扫描目录，之后的存在性判断都在内存中完成
+    with os.scandir(knowledge_dir) as it:
+        present = {entry.name for entry in it if entry.is_file()}
 
+    pending = []
     for old_id, new_id in id_mapping.items():
-        old_file = os.path.join(knowledge_dir, f"{old_id}.html")
-        new_file = os.path.join(knowledge_dir, f"{new_id}.html")
-
-        if os.path.exists(old_file):
-            # 更新HTML文件内容中的ID引用
-            with open(old_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 更新HTML文件中的ID引用（如果有的话）
-            content = content.replace(f'data-id="{old_id}"', f'data-id="{new_id}"')
+        if f"{old_id}.html" in present:
+            pending.append((old_id, new_id))
+        else:
+            print(f"⚠️  文件不存在: {os.path.join(knowledge_dir, f'{old_id}.html')}")
 
-            # 写入新文件
-            with open(new_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+    renamed_count = 0
 
-            # 删除旧文件
-            os.remove(old_file)
+    if pending:
+        pattern, replacements = compile_data_id_pattern(id_mapping)
+        with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+            results = executor.map(
+                lambda ids: _rename_html_file(knowledge_dir, *ids, pattern, replacements),
+                pending)
+            for old_id, new_id in results:
+                print(f"✅ 重命名: {old_id}.html -> {new_id}.html")
+                renamed_count += 1
 
-            print(f"✅ 重命名: {old_id}.html -> {new_id}.html")
-            renamed_count += 1
-        else:
-            print(f"⚠️  文件不存在: {old_file}")
+        # 所有重命名完成后只对目录fsync一次
+        fsync_directory(knowledge_dir)
 
     print(f"📊 总共重命名了 {renamed_count} 个HTML文件")
 
@@ -120,6 +207,12 @@ def verify_integrity(data, id_mapping):
 
     issues = []
 
+    # 一次扫描knowledge/目录，文件存在性检查改为集合查找
+    present = set()
+    if os.path.isdir('knowledge'):
+        with os.scandir('knowledge') as it:
+            present = {entry.name for entry in it if entry.is_file()}
+
     # 检查categories中的所有文章
     for category, articles in data['categories'].items():
         for article in articles:
@@ -135,22 +228,17 @@ def verify_integrity(data, id_mapping):
 
                     # 检查HTML文件是否存在
                     file_path = url
-                    if not os.path.exists(file_path):
+                    if file_path[len('knowledge/'):] not in present:
                         issues.append(f"HTML文件不存在: {file_path}")
 
     # 检查hotContent引用
     if 'hotContent' in data['metadata']:
+        article_ids = {article['id']
+                       for articles in data['categories'].values()
+                       for article in articles}
         for hot_item in data['metadata']['hotContent']:
             hot_id = hot_item['id']
-            found = False
-            for category, articles in data['categories'].items():
-                for article in articles:
-                    if article['id'] == hot_id:
-                        found = True
-                        break
-                if found:
-                    break
-            if not found:
+            if hot_id not in article_ids:
                 issues.append(f"hotContent引用的文章不存在: {hot_id}")
 
     if issues:
@@ -162,17 +250,12 @@ def verify_integrity(data, id_mapping):
         print("✅ 重构完整性验证通过!")
         return True
 
-def main():
-    print("🚀 开始标准化articles.json的ID结构...")
-
+def standardize_ids(data):
+    """对已加载的articles.json数据执行ID标准化，返回更新后的数据"""
     # 创建ID映射表
     id_mapping = create_id_mapping()
     print(f"📋 ID映射表包含 {len(id_mapping)} 个条目")
 
-    # 加载articles.json
-    print("📂 加载articles.json...")
-    data = load_articles_json()
-
     # 更新文章ID
     print("🔄 更新文章ID...")
     data = update_articles_ids(data, id_mapping)
@@ -198,5 +281,15 @@ def main():
     else:
         print("\n⚠️  重构过程中发现问题，请检查上述错误信息")
 
+    return data
+
+def main():
+    print("🚀 开始标准化articles.json的ID结构...")
+
+    # 加载articles.json
+    print("📂 加载articles.json...")
+    data = load_articles_json()
+    standardize_ids(data)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file